@@ -1,22 +1,130 @@
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Set, Optional
+from html import unescape
+from typing import List, Dict, DefaultDict, Any, Set, Optional, Tuple, Coroutine, Iterator, AsyncIterator, Iterable, Sequence, Callable
 from urllib.parse import urlencode
+import asyncio
 import json
-from bs4 import BeautifulSoup
+import re
+import threading
+import time
+from operator import attrgetter, index, itemgetter
+from bs4 import BeautifulSoup, SoupStrainer
 
 
+import aiohttp
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, BeautifulSoup is used instead
+    LexborHTMLParser = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, iter_cities then loads the full response
+    ijson = None
+
+try:
+    import tenacity
+except ImportError:  # tenacity is optional, only needed for use_tenacity
+    tenacity = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional, only needed for http_cache
+    requests_cache = None
+
+
+_ALPHABET_SECTIONS = SoupStrainer('div', class_='alphabet-item')
+# Markup the city listing scan skips: comments and raw-text elements
+_IGNORED_MARKUP_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.S | re.I)
+# Tag attributes, where quoted values may contain '>'
+_ATTRS = r"""(?:"[^"]*"|'[^']*'|[^'">])*"""
+# Tags the city listing scan follows: div boundaries, titles and list items
+_LISTING_TOKEN_RE = re.compile(r'</div\s*>|<(?P<name>div|h3|li)\b(?P<attrs>' + _ATTRS + r')>', re.I)
+_ATTR_RE = re.compile(r"""(?P<name>[^\s"'>/=]+)(?:\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'))?""")
+_TITLE_END_RE = re.compile(r'</h3\s*>', re.I)
+_ITEM_END_RE = re.compile(r'</li\s*>|<li\b|</ul\s*>', re.I)
+# Title or list item tags, however they are written; used to detect markup the scan missed
+_CITY_LISTING_TAG_RE = re.compile(r'<(?:h3|li)\b[^>]*\balphabet-(?:title|list-item)\b')
+_CITY_LISTING_CLASS_RE = re.compile(r'alphabet-(?:title|list-item)')
+_LINK_RE = re.compile(r'<a\b(?P<attrs>' + _ATTRS + r')>(?P<name>.*?)</a\s*>', re.S | re.I)
+_TAG_RE = re.compile(r'</?[a-zA-Z]' + _ATTRS + r'>')
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _tag_attributes(attrs: str) -> Dict[str, str]:
+    """
+    Parse the attribute text of a start tag
+    
+    Names are lower-cased and values unescaped. As in a browser, the first
+    occurrence of an attribute wins. Unquoted values are not supported and
+    leave the attribute without a value.
+    
+    Args:
+        attrs: Text between the tag name and the closing '>'
+        
+    Returns:
+        Attribute values by name, '' for attributes without a value
+    """
+    parsed: Dict[str, str] = {}
+    for match in _ATTR_RE.finditer(attrs):
+        value = match.group('dq')
+        if value is None:
+            value = match.group('sq') or ''
+        parsed.setdefault(match.group('name').lower(), unescape(value))
+    return parsed
+
+
+def _relevance(score: float, is_flixbus_city: bool, num_stations: int, has_train_station: bool) -> float:
+    """
+    Calculate relevance score from the raw autocomplete fields
+    
+    Shared by SearchResult.relevance and SearchResults.relevance, which
+    scores the raw columns without building SearchResult objects.
+    
+    Returns:
+        Float between 0 and 1, where 1 is most relevant
+    """
+    base_weight = score / 100  # Normalize score to 0-1 range
+    
+    # Add bonus for being a FlixBus city
+    flixbus_bonus = 0.2 if is_flixbus_city else 0
+    
+    # Add bonus for having multiple stations
+    station_bonus = min(num_stations * 0.1, 0.3)
+    
+    # Add bonus for having a train station
+    train_bonus = 0.1 if has_train_station else 0
+    
+    # Calculate final score (capped at 1.0)
+    return min(base_weight + flixbus_bonus + station_bonus + train_bonus, 1.0)
+
+
+@dataclass(slots=True, frozen=True)
 class Location:
     lat: float
     lon: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class City:
     id: int
     uuid: str
@@ -26,17 +134,17 @@ class City:
     location: Location
     slug: str
     search_volume: int
-    transportation_category: List[str]
+    transportation_category: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScrapedCity:
     name: str
     slug: str
     letter: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Station:
     id: str
     name: str
@@ -45,7 +153,7 @@ class Station:
     is_train: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     id: str
     name: str
@@ -54,7 +162,7 @@ class SearchResult:
     location: Location
     score: float
     legacy_id: int
-    stations: List[Station]
+    stations: Tuple[Station, ...]
     has_train_station: bool
     is_flixbus_city: bool
     timezone_offset_seconds: int
@@ -67,27 +175,225 @@ class SearchResult:
         Returns:
             Float between 0 and 1, where 1 is most relevant
         """
-        base_weight = self.score / 100  # Normalize score to 0-1 range
+        return _relevance(
+            self.score,
+            self.is_flixbus_city,
+            len(self.stations),
+            self.has_train_station
+        )
+
+
+def _rank(relevance: Sequence[float]) -> List[int]:
+    """
+    Order row indices by relevance, highest first
+    
+    Sorting indices by a precomputed score column keeps comparisons on
+    plain floats; ties keep their original order.
+    
+    Args:
+        relevance: Relevance score per row
+        
+    Returns:
+        Row indices sorted by descending relevance
+    """
+    return sorted(range(len(relevance)), key=relevance.__getitem__, reverse=True)
+
+
+# Field extractors for the autocomplete parser, in dataclass field order
+_get_location_fields = itemgetter("lat", "lon")
+_get_station_fields = itemgetter("id", "name", "legacy_id", "importance_order", "is_train")
+_get_result_fields = itemgetter(
+    "id",
+    "name",
+    "country",
+    "score",
+    "legacy_id",
+    "has_train_station",
+    "is_flixbus_city",
+    "timezone_offset_seconds"
+)
+
+
+def _parse_search_result(item: Dict[str, Any]) -> SearchResult:
+    """
+    Parse a single autocomplete item into a SearchResult object
+    
+    Args:
+        item: Raw autocomplete item from API
+        
+    Returns:
+        SearchResult object
+    """
+    (
+        result_id,
+        name,
+        country,
+        score,
+        legacy_id,
+        has_train_station,
+        is_flixbus_city,
+        timezone_offset_seconds
+    ) = _get_result_fields(item)
+    
+    # Create Location object
+    location = Location(*_get_location_fields(item["location"]))
+    
+    # Create Station objects
+    stations = tuple(
+        Station(*_get_station_fields(station))
+        for station in item.get("stations", ())
+    )
+    
+    # Create SearchResult object
+    return SearchResult(
+        result_id,
+        name,
+        country,
+        item.get("district"),
+        location,
+        score,
+        legacy_id,
+        stations,
+        has_train_station,
+        is_flixbus_city,
+        timezone_offset_seconds
+    )
+
+
+@dataclass
+class SearchResults:
+    """
+    Column-oriented autocomplete results
+    
+    Keeps the fields needed for ranking in parallel arrays so many
+    candidates can be scored without building a SearchResult per item.
+    Full SearchResult objects are only created on demand.
+    """
+    items: List[Dict[str, Any]]
+    ids: List[str]
+    scores: array
+    is_flixbus_city: array
+    num_stations: array
+    has_train_station: array
+    lat: array
+    lon: array
+
+    @classmethod
+    def from_response(cls, response: List[Dict[str, Any]]) -> "SearchResults":
+        """
+        Build the columns from a raw autocomplete response
+        
+        Args:
+            response: Raw autocomplete response from API
+            
+        Returns:
+            SearchResults holding one row per item, in response order
+        """
+        ids = []
+        scores = array("d")
+        is_flixbus_city = array("b")
+        num_stations = array("h")
+        has_train_station = array("b")
+        lat = array("d")
+        lon = array("d")
+        
+        for item in response:
+            ids.append(item["id"])
+            scores.append(item["score"])
+            is_flixbus_city.append(item["is_flixbus_city"])
+            num_stations.append(len(item.get("stations", [])))
+            has_train_station.append(item["has_train_station"])
+            lat.append(item["location"]["lat"])
+            lon.append(item["location"]["lon"])
+        
+        return cls(
+            items=list(response),
+            ids=ids,
+            scores=scores,
+            is_flixbus_city=is_flixbus_city,
+            num_stations=num_stations,
+            has_train_station=has_train_station,
+            lat=lat,
+            lon=lon
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def relevance(self) -> List[float]:
+        """
+        Calculate the relevance of every row
+        
+        Returns:
+            List of relevance scores, in row order
+        """
+        return list(map(
+            _relevance,
+            self.scores,
+            self.is_flixbus_city,
+            self.num_stations,
+            self.has_train_station
+        ))
+
+    def best(self) -> Optional[SearchResult]:
+        """
+        Get the most relevant row as a SearchResult
         
-        # Add bonus for being a FlixBus city
-        flixbus_bonus = 0.2 if self.is_flixbus_city else 0
+        Returns:
+            Most relevant SearchResult or None if there are no rows
+        """
+        if not self.ids:
+            return None
         
-        # Add bonus for having multiple stations
-        station_bonus = min(len(self.stations) * 0.1, 0.3)
+        relevance = self.relevance()
+        index = max(range(len(relevance)), key=relevance.__getitem__)
+        return _parse_search_result(self.items[index])
+
+    def ranked(self) -> List[SearchResult]:
+        """
+        Convert every row into a SearchResult object, most relevant first
         
-        # Add bonus for having a train station
-        train_bonus = 0.1 if self.has_train_station else 0
+        Returns:
+            List of SearchResult objects, sorted by relevance
+        """
+        return [_parse_search_result(self.items[index]) for index in _rank(self.relevance())]
+
+    def to_dataclasses(self) -> List[SearchResult]:
+        """
+        Convert every row into a SearchResult object
         
-        # Calculate final score (capped at 1.0)
-        return min(base_weight + flixbus_bonus + station_bonus + train_bonus, 1.0)
+        Returns:
+            List of SearchResult objects, in row order
+        """
+        return [_parse_search_result(item) for item in self.items]
 
 
 class FlixBusScraper:
     BASE_URL = "https://global.api.flixbus.com"
     WEB_URL = "https://flixbus.com"
+    POOL_SIZE = 64  # Keep-alive connections kept open per host
+    TIMEOUT = 10.0  # Seconds
+    SUGGEST_CACHE_SIZE = 1024  # Distinct autocomplete queries kept in memory
+    PRODUCTS_TEMPLATE = '{{"adult":{}}}'  # JSON products parameter for search_trips
+    RETRY_ATTEMPTS = 3
+    RETRY_WAIT = 4  # Seconds before the first retry, doubled for each further one
+    RETRY_MAX_WAIT = 10  # Seconds
+    RETRY_EXCEPTIONS = (requests.exceptions.RequestException, json.JSONDecodeError)  # Failures worth retrying, except 4xx responses
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        cities_cache_ttl: float = 3600,
+        suggest_cache_ttl: float = 300,
+        http_cache: Optional[str] = None,
+        http_cache_expire: float = 3600,
+        use_tenacity: bool = False
+    ):
+        self.cities_cache_ttl = cities_cache_ttl
+        self._cities_cache: Optional[Tuple[float, List[ScrapedCity]]] = None
+        self._cities_by_letter: Dict[str, List[ScrapedCity]] = {}
+        self.suggest_cache_ttl = suggest_cache_ttl
+        self._suggest_cache: OrderedDict[Tuple[Any, ...], Tuple[float, Tuple[SearchResult, ...]]] = OrderedDict()
+        self._suggest_cache_lock = threading.Lock()
         self.default_headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36",
             "Accept": "application/json",
@@ -95,15 +401,125 @@ class FlixBusScraper:
             "Origin": "https://www.flixbus.com",
             "Referer": "https://www.flixbus.com/"
         }
+        
+        # Retry with tenacity instead of the built-in loop, e.g. to attach its hooks
+        if use_tenacity and tenacity is None:
+            raise ImportError("use_tenacity requires the tenacity package")
+        self.use_tenacity = use_tenacity
+        
+        if http_cache is None:
+            self.session = requests.Session()
+        elif requests_cache is None:
+            raise ImportError("http_cache requires the requests-cache package")
+        else:
+            # Persist GET responses in SQLite so repeated runs skip the network
+            self.session = requests_cache.CachedSession(
+                http_cache,
+                backend="sqlite",
+                expire_after=http_cache_expire,
+                allowable_methods=("GET",)
+            )
+        
+        self.session.headers.update(self.default_headers)
+        self._adapter_lock = threading.Lock()
+        self._mount_adapter(self.POOL_SIZE)
+
+    def _mount_adapter(self, pool_size: int) -> None:
+        """
+        Reuse pooled keep-alive connections instead of reconnecting per request
+        
+        Closes the adapter it replaces so its sockets are released. Callers
+        other than __init__ must hold self._adapter_lock.
+        
+        Args:
+            pool_size: Number of connections kept open per host
+        """
+        old_adapter = self.session.adapters.get("https://")
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._pool_size = pool_size
+        if old_adapter is not None:
+            old_adapter.close()
+
+    def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_bypass: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request to the FlixBus API, retrying failed attempts
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            cache_bypass: Skip the HTTP cache (if enabled) for this request
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            Exception: If the last attempt fails or the response is invalid
+        """
+        if self.use_tenacity:
+            retrying = tenacity.Retrying(
+                retry=tenacity.retry_if_exception(self._is_retryable),
+                stop=tenacity.stop_after_attempt(self.RETRY_ATTEMPTS),
+                wait=tenacity.wait_exponential(multiplier=self.RETRY_WAIT, max=self.RETRY_MAX_WAIT),
+                reraise=True
+            )
+            return retrying(self._request_once, endpoint, params, cache_bypass)
+        
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return self._request_once(endpoint, params, cache_bypass)
+            except self.RETRY_EXCEPTIONS as e:
+                if attempt == self.RETRY_ATTEMPTS - 1 or not self._is_retryable(e):
+                    raise
+                time.sleep(self._retry_delay(attempt))
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        """
+        Check whether a failed attempt is worth retrying
+        
+        Client errors (HTTP status below 500) would fail the same way again,
+        so only transport, decode and server errors are retried.
+        
+        Args:
+            error: Exception raised by the attempt
+            
+        Returns:
+            True if the request should be retried
+        """
+        if not isinstance(error, self.RETRY_EXCEPTIONS):
+            return False
+        status = self._error_status(error)
+        return status is None or status >= 500
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _error_status(self, error: BaseException) -> Optional[int]:
+        """HTTP status code carried by a failed attempt, if any"""
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return error.response.status_code
+        return None
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff in seconds after the given (zero-based) failed attempt"""
+        return min(self.RETRY_MAX_WAIT, self.RETRY_WAIT * 2 ** attempt)
+
+    def _request_once(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_bypass: bool = False
+    ) -> Dict[str, Any]:
         """
-        Make a GET request to the FlixBus API
+        Make a single GET request to the FlixBus API
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            cache_bypass: Skip the HTTP cache (if enabled) for this request
             
         Returns:
             JSON response as dictionary
@@ -116,12 +532,13 @@ class FlixBusScraper:
             response = self.session.get(
                 url,
                 params=params,
-                headers=self.default_headers
+                headers=_NO_STORE_HEADERS if cache_bypass else None,
+                timeout=self.TIMEOUT
             )
             
             response.raise_for_status()
             
-            return response.json()
+            return _json_loads(response.content)
             
         except requests.exceptions.RequestException as e:
             print(f"Request failed: {str(e)}")
@@ -130,6 +547,137 @@ class FlixBusScraper:
             print(f"Failed to parse JSON response: {str(e)}")
             raise
 
+    def _cities_params(self, language: str, country: str, limit: int) -> Dict[str, Any]:
+        """Build query parameters for the city listing endpoints"""
+        return {
+            "language": language,
+            "country": country,
+            "limit": limit
+        }
+
+    def _search_trips_params(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        departure_date: datetime,
+        num_adults: int,
+        currency: str,
+        locale: str,
+        include_after_midnight: bool,
+        disable_distribusion: bool,
+        disable_global_trips: bool
+    ) -> Dict[str, Any]:
+        """
+        Build query parameters for the trip search endpoint
+        
+        Raises:
+            ValueError: If num_adults is a float with a fractional part
+            TypeError: If num_adults is not a whole number, e.g. a string
+        """
+        # Accept whole floats such as 2.0, but never round a passenger count
+        if isinstance(num_adults, float):
+            if not num_adults.is_integer():
+                raise ValueError(f"num_adults must be a whole number, got {num_adults!r}")
+            num_adults = int(num_adults)
+        
+        return {
+            "from_city_id": from_city_id,
+            "to_city_id": to_city_id,
+            "departure_date": departure_date.strftime("%d.%m.%Y"),
+            "products": self.PRODUCTS_TEMPLATE.format(index(num_adults)),
+            "currency": currency,
+            "locale": locale,
+            "search_by": "cities",
+            "include_after_midnight_rides": int(include_after_midnight),
+            "disable_distribusion_trips": int(disable_distribusion),
+            "disable_global_trips": int(disable_global_trips)
+        }
+
+    def _suggest_city_params(
+        self,
+        query: str,
+        language: str,
+        country: str,
+        flixbus_cities_only: bool,
+        include_stations: bool,
+        include_popular_stations: bool
+    ) -> Dict[str, Any]:
+        """Build query parameters for the city autocomplete endpoint"""
+        return {
+            "q": query,
+            "lang": language,
+            "country": country,
+            "flixbus_cities_only": str(flixbus_cities_only).lower(),
+            "stations": str(include_stations).lower(),
+            "popular_stations": str(include_popular_stations).lower()
+        }
+
+    def _search_analytics_params(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str,
+        metrics: Optional[List[str]],
+        currency: str,
+        locale: str
+    ) -> Dict[str, Any]:
+        """Build query parameters for the search analytics endpoint"""
+        base_params = self._search_analytics_base_params(
+            from_city_id,
+            to_city_id,
+            granularity,
+            metrics,
+            currency,
+            locale
+        )
+
+        return self._with_analytics_dates(base_params, start_date, end_date)
+
+    def _search_analytics_base_params(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        granularity: str,
+        metrics: Optional[List[str]],
+        currency: str,
+        locale: str
+    ) -> Dict[str, Any]:
+        """Build the date-independent query parameters for the search analytics endpoint"""
+        if metrics is None:
+            metrics = [
+                "search_volume",
+                "conversion_rate",
+                "average_price",
+                "occupancy_rate",
+                "cancellation_rate",
+                "mobile_searches",
+                "desktop_searches"
+            ]
+
+        return {
+            "from_city_id": from_city_id,
+            "to_city_id": to_city_id,
+            "granularity": granularity,
+            "metrics": ",".join(metrics),
+            "currency": currency,
+            "locale": locale
+        }
+
+    def _with_analytics_dates(
+        self,
+        base_params: Dict[str, Any],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, Any]:
+        """Add the date range to prebuilt search analytics parameters"""
+        return {
+            **base_params,
+            "start_date": start_date.strftime("%Y-%m-%d"),
+            "end_date": end_date.strftime("%Y-%m-%d")
+        }
+
     def get_cities(
         self,
         language: str = "en",
@@ -147,14 +695,61 @@ class FlixBusScraper:
         Returns:
             Dictionary containing cities and count
         """
-        params = {
-            "language": language,
-            "country": country,
-            "limit": limit
-        }
+        params = self._cities_params(language, country, limit)
         
         return self._make_request("cms/cities", params)
 
+    def iter_cities(
+        self,
+        language: str = "en",
+        country: str = "",
+        limit: int = 6000
+    ) -> Iterator[City]:
+        """
+        Iterate over cities where FlixBus operates as they are downloaded
+        
+        When ijson is installed the response is parsed incrementally, so
+        cities are yielded before the full payload has arrived and the
+        whole document is never held in memory.
+        
+        Args:
+            language: Two-letter language code
+            country: Two-letter country code
+            limit: Maximum number of results
+            
+        Yields:
+            City objects
+        """
+        params = self._cities_params(language, country, limit)
+        
+        if ijson is None:
+            response = self._make_request("cms/cities", params)
+            yield from map(self.parse_city, response["result"])
+            return
+        
+        try:
+            # A cached response has no body left to stream, so skip the HTTP cache
+            with self.session.get(
+                f"{self.BASE_URL}/cms/cities",
+                params=params,
+                headers=_NO_STORE_HEADERS,
+                stream=True,
+                timeout=self.TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                
+                for city_data in ijson.items(response.raw, "result.item", use_float=True):
+                    yield self.parse_city(city_data)
+                    
+        except requests.exceptions.RequestException as e:
+            print(f"Request failed: {str(e)}")
+            raise
+        except ijson.JSONError as e:
+            print(f"Failed to parse JSON response: {str(e)}")
+            raise
+
     def get_reachable_cities(
         self,
         city_id: str,
@@ -174,11 +769,7 @@ class FlixBusScraper:
         Returns:
             Dictionary containing reachable cities
         """
-        params = {
-            "language": language,
-            "country": country,
-            "limit": limit
-        }
+        params = self._cities_params(language, country, limit)
         
         return self._make_request(f"cms/cities/{city_id}/reachable", params)
 
@@ -211,40 +802,99 @@ class FlixBusScraper:
         Returns:
             Dictionary containing available trips
         """
-        products = {"adult": num_adults}
+        params = self._search_trips_params(
+            from_city_id,
+            to_city_id,
+            departure_date,
+            num_adults,
+            currency,
+            locale,
+            include_after_midnight,
+            disable_distribusion,
+            disable_global_trips
+        )
+        
+        # Availability and prices change constantly, so never serve these from the HTTP cache
+        return self._make_request("search/service/v4/search", params, cache_bypass=True)
+
+    def _map_requests(
+        self,
+        func: Callable[..., Dict[str, Any]],
+        jobs: List[Dict[str, Any]],
+        workers: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Run func(**job) for every job on a thread pool
         
-        params = {
-            "from_city_id": from_city_id,
-            "to_city_id": to_city_id,
-            "departure_date": departure_date.strftime("%d.%m.%Y"),
-            "products": json.dumps(products),
-            "currency": currency,
-            "locale": locale,
-            "search_by": "cities",
-            "include_after_midnight_rides": int(include_after_midnight),
-            "disable_distribusion_trips": int(disable_distribusion),
-            "disable_global_trips": int(disable_global_trips)
-        }
+        requests releases the GIL while waiting on the network, so threads
+        overlap the round trips. The connection pool is grown to match the
+        worker count so threads do not wait on each other's connections.
+        
+        Args:
+            func: Scraper method to call
+            jobs: Keyword arguments for each call
+            workers: Number of worker threads
+            
+        Returns:
+            Results in the same order as jobs
+        """
+        with self._adapter_lock:
+            if workers > self._pool_size:
+                self._mount_adapter(workers)
         
-        return self._make_request("search/service/v4/search", params)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: func(**job), jobs))
 
-    def parse_city(self, city_data: Dict[str, Any]) -> City:
+    def map_search_trips(self, jobs: List[Dict[str, Any]], workers: int = 16) -> List[Dict[str, Any]]:
         """
-        Parse raw city data into City object
+        Search trips for many routes or dates concurrently using threads
         
         Args:
-            city_data: Raw city data from API
+            jobs: Keyword arguments for each search_trips call
+            workers: Number of worker threads
             
         Returns:
-            City object
+            List of search responses, in the same order as jobs
         """
-        location = Location(
-            lat=city_data["location"]["lat"],
-            lon=city_data["location"]["lon"]
-        )
+        return self._map_requests(self.search_trips, jobs, workers)
+
+    def map_reachable_cities(
+        self,
+        city_ids: List[str],
+        workers: int = 16,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Get reachable cities for many origin cities concurrently using threads
         
-        return City(
-            id=city_data["id"],
+        Args:
+            city_ids: UUIDs of the origin cities
+            workers: Number of worker threads
+            **kwargs: Extra arguments passed to get_reachable_cities
+            
+        Returns:
+            List of reachable-city responses, in the same order as city_ids
+        """
+        jobs = [{"city_id": city_id, **kwargs} for city_id in city_ids]
+        return self._map_requests(self.get_reachable_cities, jobs, workers)
+
+    def parse_city(self, city_data: Dict[str, Any]) -> City:
+        """
+        Parse raw city data into City object
+        
+        Args:
+            city_data: Raw city data from API
+            
+        Returns:
+            City object
+        """
+        location = Location(
+            lat=city_data["location"]["lat"],
+            lon=city_data["location"]["lon"]
+        )
+        
+        return City(
+            id=city_data["id"],
             uuid=city_data["uuid"],
             name=city_data["name"],
             country=city_data["country"],
@@ -252,7 +902,7 @@ class FlixBusScraper:
             location=location,
             slug=city_data["slug"],
             search_volume=city_data["search_volume"],
-            transportation_category=city_data["transportation_category"]
+            transportation_category=tuple(city_data["transportation_category"])
         )
     
     
@@ -260,51 +910,57 @@ class FlixBusScraper:
         """
         Scrape all city names and slugs from flixbus.com/bus
         
+        The result is cached in memory for cities_cache_ttl seconds.
+        
         Returns:
             List of ScrapedCity objects containing name, slug, and starting letter
             
         Raises:
             Exception: If scraping fails
         """
+        if self._cities_cache is not None:
+            scraped_at, cities = self._cities_cache
+            if time.monotonic() - scraped_at < self.cities_cache_ttl:
+                return cities
+
+        cities = self.__download_all_cities()
+        
+        # Group by letter once so lookups don't have to filter the full list
+        by_letter: DefaultDict[str, List[ScrapedCity]] = defaultdict(list)
+        for city in cities:
+            by_letter[city.letter].append(city)
+        
+        self._cities_by_letter = dict(by_letter)
+        self._cities_cache = (time.monotonic(), cities)
+        return cities
+
+    def __download_all_cities(self) -> List[ScrapedCity]:
+        """
+        Download and parse the flixbus.com/bus city listing
+        
+        Returns:
+            List of ScrapedCity objects containing name, slug, and starting letter
+        """
         try:
             # Get the bus routes page
             response = self.session.get(
                 f"{self.WEB_URL}/bus",
                 headers={
-                    **self.default_headers,
                     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
-                }
+                },
+                timeout=self.TIMEOUT
             )
             response.raise_for_status()
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            cities: List[ScrapedCity] = []
-            
-            # Find all alphabet sections
-            alphabet_sections = soup.find_all('div', class_='alphabet-item')
-            
-            for section in alphabet_sections:
-                # Get the letter from the section title
-                letter = section.find('h3', class_='alphabet-title').text.strip()
-                
-                # Find all city links in this section
-                city_items = section.find_all('li', class_='alphabet-list-item')
-                
-                for item in city_items:
-                    link = item.find('a')
-                    if link:
-                        name = link.text.strip()
-                        # Extract slug from href (remove '/bus/' prefix)
-                        slug = link['href'].replace('/bus/', '')
-                        
-                        cities.append(ScrapedCity(
-                            name=name,
-                            slug=slug,
-                            letter=letter
-                        ))
-            
-            return cities
+            # Parse the HTML with selectolax when installed. Otherwise scan it,
+            # falling back to BeautifulSoup if the scan did not account for
+            # every title and list item
+            if LexborHTMLParser is not None:
+                return self.__parse_city_listing_selectolax(response.text)
+            cities = self.__parse_city_listing_regex(response.text)
+            if cities:
+                return cities
+            return self.__parse_city_listing_soup(response.text)
             
         except requests.exceptions.RequestException as e:
             print(f"Failed to scrape cities: {str(e)}")
@@ -313,6 +969,157 @@ class FlixBusScraper:
             print(f"Error parsing HTML: {str(e)}")
             raise
 
+    def __parse_city_listing_regex(self, html: str) -> List[ScrapedCity]:
+        """
+        Parse the city listing HTML with a single regex scan over its tags
+        
+        The listing is a flat run of alphabet sections, each a title followed
+        by its city links, so one pass over the markup avoids building a DOM
+        tree. Only div nesting is tracked, to tell where a section ends, and
+        markup inside other tags' attribute values is not expected.
+        
+        Args:
+            html: HTML of the flixbus.com/bus page
+            
+        Returns:
+            List of ScrapedCity objects, empty if the markup was not recognised
+        """
+        html = _IGNORED_MARKUP_RE.sub('', html)
+        cities: List[ScrapedCity] = []
+        depth = 0
+        section_depth = None  # Div depth of the open alphabet section
+        letter = None
+        num_tags = 0
+        
+        for match in _LISTING_TOKEN_RE.finditer(html):
+            name = match.group('name')
+            
+            if name is None:
+                # Closing div
+                if depth > 0:
+                    if depth == section_depth:
+                        section_depth = None
+                        letter = None
+                    depth -= 1
+                continue
+            
+            name = name.lower()
+            attrs = match.group('attrs')
+            if name == 'div':
+                depth += 1
+                if 'alphabet-item' in attrs and 'alphabet-item' in _tag_attributes(attrs).get('class', '').split():
+                    if section_depth is not None:
+                        # Nested sections, let a DOM parser decide
+                        return []
+                    section_depth = depth
+                continue
+            
+            if name != 'li' or attrs != ' class="alphabet-list-item"':  # Fast path for the usual markup
+                if not _CITY_LISTING_CLASS_RE.search(attrs):
+                    continue
+                classes = _tag_attributes(attrs).get('class', '').split()
+                if ('alphabet-title' if name == 'h3' else 'alphabet-list-item') not in classes:
+                    # Class written in a way this scan does not read
+                    return []
+            num_tags += 1
+            if section_depth is None:
+                # Title or list item outside the alphabet sections
+                continue
+            
+            if name == 'h3':
+                end = _TITLE_END_RE.search(html, match.end())
+                if end is None:
+                    return []
+                if letter is None:
+                    # Like the DOM parsers, use the section's first title
+                    letter = unescape(_TAG_RE.sub('', html[match.end():end.start()])).strip().upper()
+                continue
+            
+            end = _ITEM_END_RE.search(html, match.end())
+            link = _LINK_RE.search(html, match.end(), end.start() if end else len(html))
+            href = _tag_attributes(link.group('attrs')).get('href') if link else None
+            if href is None or letter is None:
+                # Every list item should hold a city link under a title, let a DOM parser decide
+                return []
+            
+            cities.append(ScrapedCity(
+                name=unescape(_TAG_RE.sub('', link.group('name'))).strip(),
+                slug=href.removeprefix('/bus/'),
+                letter=letter
+            ))
+        
+        # Titles or items written in a way the scan did not match
+        if num_tags != len(_CITY_LISTING_TAG_RE.findall(html)):
+            return []
+        
+        return cities
+
+    def __parse_city_listing_selectolax(self, html: str) -> List[ScrapedCity]:
+        """
+        Parse the city listing HTML with selectolax
+        
+        Args:
+            html: HTML of the flixbus.com/bus page
+            
+        Returns:
+            List of ScrapedCity objects containing name, slug, and starting letter
+        """
+        tree = LexborHTMLParser(html)
+        cities: List[ScrapedCity] = []
+        
+        for section in tree.css('div.alphabet-item'):
+            # Get the letter from the section title, normalised to upper case
+            letter = section.css_first('h3.alphabet-title').text().strip().upper()
+            
+            for item in section.css('li.alphabet-list-item'):
+                link = item.css_first('a')
+                if link is not None:
+                    cities.append(ScrapedCity(
+                        name=link.text().strip(),
+                        slug=link.attributes['href'].removeprefix('/bus/'),
+                        letter=letter
+                    ))
+        
+        return cities
+
+    def __parse_city_listing_soup(self, html: str) -> List[ScrapedCity]:
+        """
+        Parse the city listing HTML with BeautifulSoup
+        
+        Args:
+            html: HTML of the flixbus.com/bus page
+            
+        Returns:
+            List of ScrapedCity objects containing name, slug, and starting letter
+        """
+        # Only build the tree for the alphabet sections
+        soup = BeautifulSoup(html, 'html.parser', parse_only=_ALPHABET_SECTIONS)
+        cities: List[ScrapedCity] = []
+        # Local binds avoid repeated global/attribute lookups in the loop
+        append = cities.append
+        scraped_city = ScrapedCity
+        
+        # Find all alphabet sections
+        alphabet_sections = soup.find_all('div', class_='alphabet-item')
+        
+        for section in alphabet_sections:
+            # Get the letter from the section title, normalised to upper case
+            letter = section.find('h3', class_='alphabet-title').text.strip().upper()
+            
+            # Find all city links in this section
+            city_items = section.find_all('li', class_='alphabet-list-item')
+            
+            for item in city_items:
+                link = item.find('a')
+                if link:
+                    name = link.text.strip()
+                    # Extract slug from href (remove '/bus/' prefix)
+                    slug = link.attrs['href'].removeprefix('/bus/')
+                    
+                    append(scraped_city(name, slug, letter))
+        
+        return cities
+
     def get_cities_by_letter(self, letter: str) -> List[ScrapedCity]:
         """
         Get all cities starting with a specific letter
@@ -323,8 +1130,9 @@ class FlixBusScraper:
         Returns:
             List of ScrapedCity objects for that letter
         """
-        cities = self.__scrape_all_cities()
-        return [city for city in cities if city.letter.upper() == letter.upper()]
+        # Refreshes the letter index when the cached scrape has expired
+        self.__scrape_all_cities()
+        return list(self._cities_by_letter.get(letter.upper(), []))
 
     def get_unique_city_letters(self) -> Set[str]:
         """
@@ -333,8 +1141,8 @@ class FlixBusScraper:
         Returns:
             Set of letters that cities start with
         """
-        cities = self.__scrape_all_cities()
-        return {city.letter for city in cities}
+        self.__scrape_all_cities()
+        return set(self._cities_by_letter)
     
     def suggest_city(
         self,
@@ -359,69 +1167,150 @@ class FlixBusScraper:
         Returns:
             List of SearchResult objects, sorted by relevance
         """
-        params = {
-            "q": query,
-            "lang": language,
-            "country": country,
-            "flixbus_cities_only": str(flixbus_cities_only).lower(),
-            "stations": str(include_stations).lower(),
-            "popular_stations": str(include_popular_stations).lower()
-        }
+        params = self._suggest_city_params(
+            query,
+            language,
+            country,
+            flixbus_cities_only,
+            include_stations,
+            include_popular_stations
+        )
+        
+        cache_key = tuple(params.values())
+        cached = self._get_cached_suggestions(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            response = self._make_request("search/autocomplete/cities", params)
+            results = self._sort_by_relevance(self._iter_suggestions(params))
             
-            # Parse results into SearchResult objects
-            results = []
-            for item in response:
-                # Create Location object
-                location = Location(
-                    lat=item["location"]["lat"],
-                    lon=item["location"]["lon"]
-                )
-                
-                # Create Station objects
-                stations = [
-                    Station(
-                        id=station["id"],
-                        name=station["name"],
-                        legacy_id=station["legacy_id"],
-                        importance_order=station["importance_order"],
-                        is_train=station["is_train"]
-                    )
-                    for station in item.get("stations", [])
-                ]
-                
-                # Create SearchResult object
-                result = SearchResult(
-                    id=item["id"],
-                    name=item["name"],
-                    country=item["country"],
-                    district=item.get("district"),
-                    location=location,
-                    score=item["score"],
-                    legacy_id=item["legacy_id"],
-                    stations=stations,
-                    has_train_station=item["has_train_station"],
-                    is_flixbus_city=item["is_flixbus_city"],
-                    timezone_offset_seconds=item["timezone_offset_seconds"]
-                )
-                
-                results.append(result)
+        except Exception as e:
+            print(f"Failed to search for city: {str(e)}")
+            raise
+        
+        self._cache_suggestions(cache_key, results)
+        return results
+
+    def _get_cached_suggestions(self, key: Tuple[Any, ...]) -> Optional[List[SearchResult]]:
+        """
+        Look up cached suggest_city results
+        
+        Args:
+            key: Autocomplete query parameters
             
-            # Sort results by relevance score (descending)
-            results.sort(key=lambda x: x.relevance, reverse=True)
+        Returns:
+            Copy of the cached results, or None if missing or expired
+        """
+        with self._suggest_cache_lock:
+            entry = self._suggest_cache.get(key)
+            if entry is None:
+                return None
             
-            return results
+            cached_at, results = entry
+            if time.monotonic() - cached_at >= self.suggest_cache_ttl:
+                del self._suggest_cache[key]
+                return None
+            
+            self._suggest_cache.move_to_end(key)
+            return list(results)
+
+    def _cache_suggestions(self, key: Tuple[Any, ...], results: List[SearchResult]) -> None:
+        """
+        Store suggest_city results, evicting the least recently used entry when full
+        
+        Args:
+            key: Autocomplete query parameters
+            results: Parsed results for those parameters
+        """
+        with self._suggest_cache_lock:
+            self._suggest_cache[key] = (time.monotonic(), tuple(results))
+            self._suggest_cache.move_to_end(key)
+            if len(self._suggest_cache) > self.SUGGEST_CACHE_SIZE:
+                self._suggest_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop cached autocomplete results and the scraped city listing"""
+        with self._suggest_cache_lock:
+            self._suggest_cache.clear()
+        self._cities_cache = None
+        self._cities_by_letter = {}
+
+    def suggest_city_columns(
+        self,
+        query: str,
+        language: str = "en",
+        country: str = "nl",
+        flixbus_cities_only: bool = False,
+        include_stations: bool = True,
+        include_popular_stations: bool = True
+    ) -> SearchResults:
+        """
+        Search for cities by name and return column-oriented results
+        
+        Same request as suggest_city, but the response is kept as
+        SearchResults columns for ranking or filtering many candidates.
+        
+        Args:
+            query: City name to search for
+            language: Two-letter language code
+            country: Two-letter country code
+            flixbus_cities_only: Only return cities served by FlixBus
+            include_stations: Include station information
+            include_popular_stations: Include popular stations
+            
+        Returns:
+            SearchResults in response order
+        """
+        params = self._suggest_city_params(
+            query,
+            language,
+            country,
+            flixbus_cities_only,
+            include_stations,
+            include_popular_stations
+        )
+        
+        try:
+            response = self._make_request("search/autocomplete/cities", params)
+            return SearchResults.from_response(response)
             
         except Exception as e:
             print(f"Failed to search for city: {str(e)}")
             raise
 
+    def _iter_suggestions(self, params: Dict[str, Any]) -> Iterator[SearchResult]:
+        """
+        Request autocomplete results and yield them unsorted as they are parsed
+        
+        Args:
+            params: Autocomplete query parameters
+            
+        Yields:
+            SearchResult objects, in response order
+        """
+        response = self._make_request("search/autocomplete/cities", params)
+        yield from map(_parse_search_result, response)
+
+    def _sort_by_relevance(self, results: Iterable[SearchResult]) -> List[SearchResult]:
+        """
+        Sort SearchResult objects by relevance
+        
+        Args:
+            results: SearchResult objects in any order
+            
+        Returns:
+            List of SearchResult objects, sorted by relevance
+        """
+        # Sort results by relevance score (descending)
+        return sorted(results, key=attrgetter("relevance"), reverse=True)
+
     def get_best_match(self, query: str, language: str = "en", country: str = "de") -> Optional[SearchResult]:
         """
         Get the most relevant match for a city search
         
+        Takes the maximum over the parsed results instead of sorting them,
+        unless suggest_city already has these results cached.
+        
         Args:
             query: City name to search for
             language: Two-letter language code
@@ -430,8 +1319,18 @@ class FlixBusScraper:
         Returns:
             Most relevant SearchResult or None if no matches found
         """
-        results = self.suggest_city(query, language, country)
-        return results[0] if results else None
+        params = self._suggest_city_params(query, language, country, False, True, True)
+        
+        cached = self._get_cached_suggestions(tuple(params.values()))
+        if cached is not None:
+            return cached[0] if cached else None
+        
+        try:
+            return max(self._iter_suggestions(params), key=attrgetter("relevance"), default=None)
+            
+        except Exception as e:
+            print(f"Failed to search for city: {str(e)}")
+            raise
     
     def get_search_analytics(
         self,
@@ -460,31 +1359,449 @@ class FlixBusScraper:
         Returns:
             Dictionary containing search analytics data
         """
-        if metrics is None:
-            metrics = [
-                "search_volume",
-                "conversion_rate",
-                "average_price",
-                "occupancy_rate",
-                "cancellation_rate",
-                "mobile_searches",
-                "desktop_searches"
-            ]
-        
-        params = {
-            "from_city_id": from_city_id,
-            "to_city_id": to_city_id,
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d"),
-            "granularity": granularity,
-            "metrics": ",".join(metrics),
-            "currency": currency,
-            "locale": locale
-        }
+        params = self._search_analytics_params(
+            from_city_id,
+            to_city_id,
+            start_date,
+            end_date,
+            granularity,
+            metrics,
+            currency,
+            locale
+        )
         
         return self._make_request("search/service/v4/analytics", params)
 
-    
+    def prepare_analytics(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        granularity: str = "daily",  # Options: hourly, daily, weekly, monthly
+        metrics: List[str] = None,
+        currency: str = "EUR",
+        locale: str = "en"
+    ) -> Callable[[datetime, datetime], Dict[str, Any]]:
+        """
+        Prepare search analytics requests for one route over many date ranges
+        
+        The route, metrics and locale parameters are built once, so each
+        call only adds the two dates. Useful when backfilling analytics
+        range by range. On AsyncFlixBusScraper the returned function
+        returns an awaitable.
+        
+        Args:
+            from_city_id: UUID of departure city
+            to_city_id: UUID of arrival city
+            granularity: Time granularity (hourly, daily, weekly, monthly)
+            metrics: List of metrics to retrieve (defaults to all)
+            currency: Three-letter currency code
+            locale: Two-letter locale code
+            
+        Returns:
+            Function taking (start_date, end_date) and returning search analytics data
+        """
+        base_params = self._search_analytics_base_params(
+            from_city_id,
+            to_city_id,
+            granularity,
+            metrics,
+            currency,
+            locale
+        )
+        
+        def get_analytics(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+            params = self._with_analytics_dates(base_params, start_date, end_date)
+            return self._make_request("search/service/v4/analytics", params)
+        
+        return get_analytics
+
+
+class AsyncFlixBusScraper(FlixBusScraper):
+    """
+    FlixBus API client built on aiohttp
+
+    API methods are coroutines so many requests can be in flight at once
+    (e.g. with asyncio.gather). Use as an async context manager, or call
+    close() when done.
+
+    The flixbus.com city listing is still scraped with the requests session
+    (and its HTTP cache, if enabled), on a worker thread.
+    """
+
+    RETRY_EXCEPTIONS = (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError)
+
+    def __init__(self, concurrency: int = 32, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.concurrency = concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncFlixBusScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the aiohttp session inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.default_headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.POOL_SIZE,
+                    limit_per_host=self.concurrency,
+                    keepalive_timeout=30
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session and the requests session used for scraping"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.session.close()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_bypass: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request to the FlixBus API, retrying failed attempts
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            cache_bypass: Accepted for compatibility with FlixBusScraper; the
+                aiohttp client has no HTTP cache, so every request is fresh
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            Exception: If the last attempt fails or the response is invalid
+        """
+        if self.use_tenacity:
+            retrying = tenacity.AsyncRetrying(
+                retry=tenacity.retry_if_exception(self._is_retryable),
+                stop=tenacity.stop_after_attempt(self.RETRY_ATTEMPTS),
+                wait=tenacity.wait_exponential(multiplier=self.RETRY_WAIT, max=self.RETRY_MAX_WAIT),
+                reraise=True
+            )
+            return await retrying(self._request_once, endpoint, params)
+
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return await self._request_once(endpoint, params)
+            except self.RETRY_EXCEPTIONS as e:
+                if attempt == self.RETRY_ATTEMPTS - 1 or not self._is_retryable(e):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+
+    def _error_status(self, error: BaseException) -> Optional[int]:
+        """HTTP status code carried by a failed attempt, if any"""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status
+        return None
+
+    async def _request_once(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a single GET request to the FlixBus API
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            Exception: If request fails or response is invalid
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+
+        try:
+            async with self._get_session().get(url, params=params) as response:
+                response.raise_for_status()
+                return _json_loads(await response.read())
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Request failed: {str(e)}")
+            raise
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse JSON response: {str(e)}")
+            raise
+
+    async def bulk(
+        self,
+        calls: List[Coroutine[Any, Any, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Run many request coroutines concurrently
+        
+        Args:
+            calls: Coroutines to await, e.g. [scraper.get_cities(...), ...]
+            concurrency: Maximum number of calls in flight (defaults to
+                self.concurrency). Capped at self.concurrency, the
+                connector's per-host limit, so calls never queue for a
+                connection while their request timeout is running.
+            
+        Returns:
+            Results in the same order as calls
+            
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            # Nothing will await the calls, so close them to avoid "never awaited" warnings
+            for call in calls:
+                call.close()
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(min(concurrency, self.concurrency))
+
+        async def guarded(call: Coroutine[Any, Any, Any]) -> Any:
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(guarded(call) for call in calls))
+
+    async def bulk_search_trips(
+        self,
+        pairs: List[Tuple[str, str]],
+        dates: List[datetime],
+        concurrency: Optional[int] = None,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Search trips for every (from, to) pair on every date concurrently
+        
+        Args:
+            pairs: List of (from_city_id, to_city_id) tuples
+            dates: Departure dates to search for each pair
+            concurrency: Maximum number of requests in flight
+            **kwargs: Extra arguments passed to search_trips
+            
+        Returns:
+            List of search responses, ordered by pair and then by date
+        """
+        calls = [
+            self.search_trips(from_city_id, to_city_id, departure_date, **kwargs)
+            for from_city_id, to_city_id in pairs
+            for departure_date in dates
+        ]
+
+        return await self.bulk(calls, concurrency)
+
+    async def map_search_trips(self, jobs: List[Dict[str, Any]], workers: int = 16) -> List[Dict[str, Any]]:
+        """Async version of FlixBusScraper.map_search_trips; workers caps the requests in flight (see bulk)"""
+        return await self.bulk([self.search_trips(**job) for job in jobs], workers)
+
+    async def map_reachable_cities(
+        self,
+        city_ids: List[str],
+        workers: int = 16,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """Async version of FlixBusScraper.map_reachable_cities; workers caps the requests in flight (see bulk)"""
+        calls = [self.get_reachable_cities(city_id, **kwargs) for city_id in city_ids]
+
+        return await self.bulk(calls, workers)
+
+    async def get_cities(
+        self,
+        language: str = "en",
+        country: str = "",
+        limit: int = 6000
+    ) -> Dict[str, Any]:
+        """Async version of FlixBusScraper.get_cities"""
+        params = self._cities_params(language, country, limit)
+
+        return await self._make_request("cms/cities", params)
+
+    async def iter_cities(
+        self,
+        language: str = "en",
+        country: str = "",
+        limit: int = 6000
+    ) -> AsyncIterator[City]:
+        """Async version of FlixBusScraper.iter_cities, used with async for"""
+        params = self._cities_params(language, country, limit)
+
+        if ijson is None:
+            response = await self._make_request("cms/cities", params)
+            for city_data in response["result"]:
+                yield self.parse_city(city_data)
+            return
+
+        try:
+            async with self._get_session().get(f"{self.BASE_URL}/cms/cities", params=params) as response:
+                response.raise_for_status()
+
+                async for city_data in ijson.items_async(response.content, "result.item", use_float=True):
+                    yield self.parse_city(city_data)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Request failed: {str(e)}")
+            raise
+        except ijson.JSONError as e:
+            print(f"Failed to parse JSON response: {str(e)}")
+            raise
+
+    async def get_reachable_cities(
+        self,
+        city_id: str,
+        language: str = "en",
+        country: str = "NL",
+        limit: int = 5
+    ) -> Dict[str, Any]:
+        """Async version of FlixBusScraper.get_reachable_cities"""
+        params = self._cities_params(language, country, limit)
+
+        return await self._make_request(f"cms/cities/{city_id}/reachable", params)
+
+    async def search_trips(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        departure_date: datetime,
+        num_adults: int = 1,
+        currency: str = "EUR",
+        locale: str = "en",
+        include_after_midnight: bool = True,
+        disable_distribusion: bool = False,
+        disable_global_trips: bool = False
+    ) -> Dict[str, Any]:
+        """Async version of FlixBusScraper.search_trips"""
+        params = self._search_trips_params(
+            from_city_id,
+            to_city_id,
+            departure_date,
+            num_adults,
+            currency,
+            locale,
+            include_after_midnight,
+            disable_distribusion,
+            disable_global_trips
+        )
+
+        return await self._make_request("search/service/v4/search", params)
+
+    async def suggest_city(
+        self,
+        query: str,
+        language: str = "en",
+        country: str = "nl",
+        flixbus_cities_only: bool = False,
+        include_stations: bool = True,
+        include_popular_stations: bool = True
+    ) -> List[SearchResult]:
+        """Async version of FlixBusScraper.suggest_city"""
+        params = self._suggest_city_params(
+            query,
+            language,
+            country,
+            flixbus_cities_only,
+            include_stations,
+            include_popular_stations
+        )
+
+        cache_key = tuple(params.values())
+        cached = self._get_cached_suggestions(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._make_request("search/autocomplete/cities", params)
+            results = self._sort_by_relevance(map(_parse_search_result, response))
+
+        except Exception as e:
+            print(f"Failed to search for city: {str(e)}")
+            raise
+
+        self._cache_suggestions(cache_key, results)
+        return results
+
+    async def suggest_city_columns(
+        self,
+        query: str,
+        language: str = "en",
+        country: str = "nl",
+        flixbus_cities_only: bool = False,
+        include_stations: bool = True,
+        include_popular_stations: bool = True
+    ) -> SearchResults:
+        """Async version of FlixBusScraper.suggest_city_columns"""
+        params = self._suggest_city_params(
+            query,
+            language,
+            country,
+            flixbus_cities_only,
+            include_stations,
+            include_popular_stations
+        )
+
+        try:
+            response = await self._make_request("search/autocomplete/cities", params)
+            return SearchResults.from_response(response)
+
+        except Exception as e:
+            print(f"Failed to search for city: {str(e)}")
+            raise
+
+    async def get_best_match(self, query: str, language: str = "en", country: str = "de") -> Optional[SearchResult]:
+        """Async version of FlixBusScraper.get_best_match"""
+        params = self._suggest_city_params(query, language, country, False, True, True)
+
+        cached = self._get_cached_suggestions(tuple(params.values()))
+        if cached is not None:
+            return cached[0] if cached else None
+
+        try:
+            response = await self._make_request("search/autocomplete/cities", params)
+            return max(map(_parse_search_result, response), key=attrgetter("relevance"), default=None)
+
+        except Exception as e:
+            print(f"Failed to search for city: {str(e)}")
+            raise
+
+    async def get_search_analytics(
+        self,
+        from_city_id: str,
+        to_city_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str = "daily",  # Options: hourly, daily, weekly, monthly
+        metrics: List[str] = None,
+        currency: str = "EUR",
+        locale: str = "en"
+    ) -> Dict[str, Any]:
+        """Async version of FlixBusScraper.get_search_analytics"""
+        params = self._search_analytics_params(
+            from_city_id,
+            to_city_id,
+            start_date,
+            end_date,
+            granularity,
+            metrics,
+            currency,
+            locale
+        )
+
+        return await self._make_request("search/service/v4/analytics", params)
+
+    async def get_cities_by_letter(self, letter: str) -> List[ScrapedCity]:
+        """Async version of FlixBusScraper.get_cities_by_letter; the page is scraped on a worker thread"""
+        return await asyncio.to_thread(super().get_cities_by_letter, letter)
+
+    async def get_unique_city_letters(self) -> Set[str]:
+        """Async version of FlixBusScraper.get_unique_city_letters; the page is scraped on a worker thread"""
+        return await asyncio.to_thread(super().get_unique_city_letters)
 
 
 if __name__ == "__main__":
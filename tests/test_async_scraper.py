@@ -0,0 +1,46 @@
+import asyncio
+from unittest import mock
+
+import flix
+
+from test_city_listing import EXPECTED, LISTING_HTML
+
+
+def test_city_listing_is_scraped_off_the_event_loop():
+    scraper = flix.AsyncFlixBusScraper()
+    response = mock.Mock(text=LISTING_HTML)
+
+    async def scrape():
+        return (
+            await scraper.get_cities_by_letter("b"),
+            await scraper.get_unique_city_letters()
+        )
+
+    with mock.patch.object(scraper.session, "get", return_value=response) as get:
+        assert asyncio.run(scrape()) == (EXPECTED[4:], {"A", "B"})
+
+    # The second call is served from the cities cache
+    get.assert_called_once()
+
+
+def test_close_closes_requests_session():
+    scraper = flix.AsyncFlixBusScraper()
+
+    with mock.patch.object(scraper.session, "close") as close:
+        asyncio.run(scraper.close())
+
+    close.assert_called_once()
+
+
+def test_async_context_manager_closes_sessions():
+    async def use():
+        async with flix.AsyncFlixBusScraper() as scraper:
+            aiohttp_session = scraper._get_session()
+        return scraper, aiohttp_session
+
+    with mock.patch.object(flix.requests.Session, "close") as close:
+        scraper, aiohttp_session = asyncio.run(use())
+
+    assert aiohttp_session.closed
+    assert scraper._session is None
+    close.assert_called_once()
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+import flix
+
+
+def run_bulk(concurrency, scraper_concurrency=2, num_calls=20):
+    scraper = flix.AsyncFlixBusScraper(concurrency=scraper_concurrency)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call(value):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return value
+
+    results = asyncio.run(scraper.bulk([call(i) for i in range(num_calls)], concurrency))
+    return results, max_in_flight
+
+
+def test_bulk_keeps_call_order():
+    results, _ = run_bulk(None)
+
+    assert results == list(range(20))
+
+
+def test_bulk_defaults_to_scraper_concurrency():
+    _, max_in_flight = run_bulk(None, scraper_concurrency=4)
+
+    assert max_in_flight == 4
+
+
+def test_bulk_honours_lower_concurrency():
+    _, max_in_flight = run_bulk(1, scraper_concurrency=4)
+
+    assert max_in_flight == 1
+
+
+def test_bulk_caps_concurrency_at_connector_limit():
+    _, max_in_flight = run_bulk(20, scraper_concurrency=2)
+
+    assert max_in_flight == 2
+
+
+def test_bulk_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        run_bulk(0)
@@ -0,0 +1,168 @@
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+import flix
+
+from test_city_listing import EXPECTED, LISTING_HTML
+
+
+def suggestion(name, score):
+    return {
+        "id": name.lower(),
+        "name": name,
+        "country": "de",
+        "location": {"lat": 1.0, "lon": 2.0},
+        "score": score,
+        "legacy_id": 1,
+        "has_train_station": False,
+        "is_flixbus_city": True,
+        "timezone_offset_seconds": 3600,
+        "stations": [],
+    }
+
+
+def json_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with mock.patch.object(flix.time, "monotonic", clock):
+        yield clock
+
+
+@pytest.fixture
+def scraper():
+    return flix.FlixBusScraper(suggest_cache_ttl=60, cities_cache_ttl=600)
+
+
+@pytest.fixture
+def api(scraper):
+    """Autocomplete endpoint answering every query with two cities"""
+    payload = [suggestion("Berlin", 50), suggestion("Bernau", 90)]
+    with mock.patch.object(scraper.session, "get", side_effect=lambda *a, **kw: json_response(payload)) as get:
+        yield get
+
+
+def test_suggest_city_sorts_and_caches(scraper, api, clock):
+    first = scraper.suggest_city("ber")
+    second = scraper.suggest_city("ber")
+
+    assert [result.name for result in first] == ["Bernau", "Berlin"]
+    assert second == first
+    assert api.call_count == 1
+
+
+def test_suggest_cache_expires_after_ttl(scraper, api, clock):
+    scraper.suggest_city("ber")
+    clock.now += 59
+    scraper.suggest_city("ber")
+    assert api.call_count == 1
+
+    clock.now += 1
+    scraper.suggest_city("ber")
+    assert api.call_count == 2
+
+
+def test_suggest_cache_hit_returns_a_copy(scraper, api, clock):
+    first = scraper.suggest_city("ber")
+    first.clear()
+
+    assert len(scraper.suggest_city("ber")) == 2
+    assert api.call_count == 1
+
+
+def test_suggest_cache_evicts_least_recently_used(scraper, api, clock):
+    scraper.SUGGEST_CACHE_SIZE = 2
+    scraper.suggest_city("a")
+    scraper.suggest_city("b")
+    scraper.suggest_city("a")  # Now "b" is the least recently used
+    scraper.suggest_city("c")
+    assert api.call_count == 3
+
+    scraper.suggest_city("a")
+    assert api.call_count == 3
+
+    scraper.suggest_city("b")
+    assert api.call_count == 4
+
+
+def test_get_best_match_uses_suggest_cache(scraper, api, clock):
+    assert scraper.get_best_match("ber").name == "Bernau"
+    assert api.call_count == 1
+
+    scraper.suggest_city("ber", country="de")
+    assert scraper.get_best_match("ber").name == "Bernau"
+    assert api.call_count == 2
+
+
+def test_clear_cache_drops_suggestions(scraper, api, clock):
+    scraper.suggest_city("ber")
+    scraper.clear_cache()
+    scraper.suggest_city("ber")
+
+    assert api.call_count == 2
+
+
+@pytest.fixture
+def listing(scraper):
+    """City listing page, served from a mutable HTML string"""
+    page = {"html": LISTING_HTML}
+    with mock.patch.object(
+        scraper.session, "get", side_effect=lambda *a, **kw: mock.Mock(text=page["html"])
+    ) as get:
+        get.page = page
+        yield get
+
+
+def test_city_listing_is_cached(scraper, listing, clock):
+    assert scraper.get_cities_by_letter("a") == EXPECTED[:4]
+    assert scraper.get_unique_city_letters() == {"A", "B"}
+    assert scraper.get_cities_by_letter("B") == EXPECTED[4:]
+
+    assert listing.call_count == 1
+
+
+def test_city_listing_lookup_returns_a_copy(scraper, listing, clock):
+    scraper.get_cities_by_letter("a").clear()
+
+    assert scraper.get_cities_by_letter("a") == EXPECTED[:4]
+
+
+def test_city_listing_refreshes_letter_index_after_ttl(scraper, listing, clock):
+    scraper.get_cities_by_letter("a")
+    listing.page["html"] = LISTING_HTML.replace('<h3 class="alphabet-title">b</h3>', '<h3 class="alphabet-title">c</h3>')
+
+    clock.now += 599
+    assert scraper.get_unique_city_letters() == {"A", "B"}
+
+    clock.now += 1
+    assert scraper.get_unique_city_letters() == {"A", "C"}
+    assert scraper.get_cities_by_letter("b") == []
+    assert [city.slug for city in scraper.get_cities_by_letter("c")] == ["berlin?a=1&b=2", "bonn"]
+    assert listing.call_count == 2
+
+
+def test_clear_cache_drops_city_listing(scraper, listing, clock):
+    scraper.get_cities_by_letter("a")
+    scraper.clear_cache()
+    scraper.get_cities_by_letter("a")
+
+    assert listing.call_count == 2
@@ -0,0 +1,136 @@
+from unittest import mock
+
+import pytest
+
+import flix
+
+
+LISTING_HTML = """
+<html>
+<head><style>.alphabet-list-item { display: block; }</style></head>
+<body>
+<ul><li class="alphabet-list-item"><a href="/bus/stray">Stray</a></li></ul>
+<div class="alphabet-item">
+  <h3 class="alphabet-title"> A </h3>
+  <ul class="alphabet-list">
+    <li class="alphabet-list-item"><a href="/bus/amsterdam">Amsterdam</a></li>
+    <li class="alphabet-list-item foo">
+      <a class="link" href="/bus/aachen"> Aachen <small>DE</small></a>
+    </li>
+    <li class="alphabet-list-item"><span class="icon"></span><a href="/bus/antwerp">Antwerp</a></li>
+    <li class='alphabet-list-item'><a href='/bus/arnhem'>Arnhem</a></li>
+  </ul>
+</div>
+<div class="alphabet-item">
+  <h3 class="alphabet-title">b</h3>
+  <ul class="alphabet-list">
+    <li class="alphabet-list-item"><a data-id="1" href="/bus/berlin?a=1&amp;b=2">Berlin &amp; Co</a></li>
+    <li class="alphabet-list-item"><a href="/bus/bonn">Bonn</a>
+  </ul>
+</div>
+</body>
+</html>
+"""
+
+EXPECTED = [
+    flix.ScrapedCity(name="Amsterdam", slug="amsterdam", letter="A"),
+    flix.ScrapedCity(name="Aachen DE", slug="aachen", letter="A"),
+    flix.ScrapedCity(name="Antwerp", slug="antwerp", letter="A"),
+    flix.ScrapedCity(name="Arnhem", slug="arnhem", letter="A"),
+    flix.ScrapedCity(name="Berlin & Co", slug="berlin?a=1&b=2", letter="B"),
+    flix.ScrapedCity(name="Bonn", slug="bonn", letter="B"),
+]
+
+
+@pytest.fixture
+def scraper():
+    return flix.FlixBusScraper()
+
+
+def parse_regex(scraper, html):
+    return scraper._FlixBusScraper__parse_city_listing_regex(html)
+
+
+def parse_soup(scraper, html):
+    return scraper._FlixBusScraper__parse_city_listing_soup(html)
+
+
+def parse_selectolax(scraper, html):
+    pytest.importorskip("selectolax")
+    return scraper._FlixBusScraper__parse_city_listing_selectolax(html)
+
+
+@pytest.mark.parametrize("parse", [parse_regex, parse_soup, parse_selectolax])
+def test_parsers_agree_on_listing(scraper, parse):
+    assert parse(scraper, LISTING_HTML) == EXPECTED
+
+
+@pytest.mark.parametrize("old, new", [
+    # List item after the last alphabet section, e.g. in a footer
+    (
+        "</body>",
+        '<ul><li class="alphabet-list-item"><a href="/bus/footer">Footer</a></li></ul></body>'
+    ),
+    # List item inside a comment
+    (
+        '<li class="alphabet-list-item"><a href="/bus/bonn">',
+        '<!-- <li class="alphabet-list-item"><a href="/bus/ghost">Ghost</a></li> -->'
+        '<li class="alphabet-list-item"><a href="/bus/bonn">'
+    ),
+    # '>' inside a quoted attribute value
+    (
+        '<a href="/bus/amsterdam">',
+        '<a title="a>b" href="/bus/amsterdam">'
+    ),
+])
+@pytest.mark.parametrize("parse", [parse_regex, parse_soup, parse_selectolax])
+def test_parsers_agree_on_tricky_markup(scraper, parse, old, new):
+    html = LISTING_HTML.replace(old, new, 1)
+
+    assert parse(scraper, html) == EXPECTED
+
+
+def test_regex_rejects_unrecognised_markup(scraper):
+    assert parse_regex(scraper, "<div>no listing here</div>") == []
+
+
+def test_regex_rejects_list_item_without_link(scraper):
+    html = LISTING_HTML.replace(
+        '<a href="/bus/bonn">Bonn</a>',
+        '<span>Bonn</span>'
+    )
+
+    assert parse_regex(scraper, html) == []
+    assert parse_soup(scraper, html) == EXPECTED[:-1]
+
+
+def test_regex_rejects_unmatched_tags(scraper):
+    html = LISTING_HTML.replace(
+        '<li class="alphabet-list-item"><a href="/bus/bonn">',
+        '<li class=alphabet-list-item><a href="/bus/bonn">'
+    )
+
+    assert parse_regex(scraper, html) == []
+
+
+def test_download_falls_back_to_dom_parser(scraper):
+    html = LISTING_HTML.replace(
+        '<a href="/bus/bonn">Bonn</a>',
+        '<span>Bonn</span>'
+    )
+    response = mock.Mock(text=html)
+
+    with mock.patch.object(flix, "LexborHTMLParser", None), \
+            mock.patch.object(scraper.session, "get", return_value=response):
+        assert scraper.get_cities_by_letter("b") == [EXPECTED[4]]
+
+
+@pytest.mark.parametrize("selectolax", [True, False])
+def test_download_parses_listing(scraper, selectolax):
+    if selectolax:
+        pytest.importorskip("selectolax")
+    response = mock.Mock(text=LISTING_HTML)
+
+    with mock.patch.object(flix, "LexborHTMLParser", flix.LexborHTMLParser if selectolax else None), \
+            mock.patch.object(scraper.session, "get", return_value=response):
+        assert scraper.get_cities_by_letter("a") == EXPECTED[:4]
@@ -0,0 +1,110 @@
+import asyncio
+from unittest import mock
+
+import aiohttp
+import pytest
+import requests
+
+import flix
+
+
+def make_response(status, content=b'{"ok": true}'):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.url = "https://global.api.flixbus.com/test"
+    return response
+
+
+@pytest.fixture(params=[False, True], ids=["loop", "tenacity"])
+def scraper(request):
+    if request.param:
+        pytest.importorskip("tenacity")
+    return flix.FlixBusScraper(use_tenacity=request.param)
+
+
+def run(scraper, responses):
+    """Make one request against canned responses, returning (result or error, attempts, sleeps)"""
+    sleeps = []
+
+    with mock.patch.object(scraper.session, "get", side_effect=responses) as get, \
+            mock.patch.object(flix.time, "sleep", side_effect=sleeps.append), \
+            mock.patch("builtins.print"):
+        try:
+            result = scraper._make_request("test")
+        except Exception as e:
+            result = e
+
+    return result, get.call_count, sleeps
+
+
+def test_success_is_not_retried(scraper):
+    result, attempts, sleeps = run(scraper, [make_response(200)])
+
+    assert result == {"ok": True}
+    assert attempts == 1
+    assert sleeps == []
+
+
+def test_server_errors_are_retried_with_backoff(scraper):
+    result, attempts, sleeps = run(scraper, [make_response(503), make_response(502), make_response(200)])
+
+    assert result == {"ok": True}
+    assert attempts == 3
+    assert sleeps == [4, 8]
+
+
+def test_gives_up_after_retry_attempts(scraper):
+    result, attempts, sleeps = run(scraper, [make_response(500)] * 5)
+
+    assert isinstance(result, requests.exceptions.HTTPError)
+    assert attempts == scraper.RETRY_ATTEMPTS
+    assert len(sleeps) == scraper.RETRY_ATTEMPTS - 1
+
+
+def test_transport_and_decode_errors_are_retried(scraper):
+    responses = [requests.exceptions.ConnectionError("reset"), make_response(200, b"not json"), make_response(200)]
+
+    result, attempts, _ = run(scraper, responses)
+
+    assert result == {"ok": True}
+    assert attempts == 3
+
+
+@pytest.mark.parametrize("status", [400, 404, 429])
+def test_client_errors_are_not_retried(scraper, status):
+    result, attempts, sleeps = run(scraper, [make_response(status), make_response(200)])
+
+    assert isinstance(result, requests.exceptions.HTTPError)
+    assert attempts == 1
+    assert sleeps == []
+
+
+def test_other_errors_are_not_retried(scraper):
+    result, attempts, _ = run(scraper, [KeyError("boom"), make_response(200)])
+
+    assert isinstance(result, KeyError)
+    assert attempts == 1
+
+
+def test_backoff_is_capped():
+    scraper = flix.FlixBusScraper()
+
+    assert [scraper._retry_delay(attempt) for attempt in range(4)] == [4, 8, 10, 10]
+
+
+@pytest.mark.parametrize("use_tenacity", [False, True], ids=["loop", "tenacity"])
+@pytest.mark.parametrize("status, attempts", [(404, 1), (503, 3)])
+def test_async_retries_only_server_errors(use_tenacity, status, attempts):
+    if use_tenacity:
+        pytest.importorskip("tenacity")
+    scraper = flix.AsyncFlixBusScraper(use_tenacity=use_tenacity)
+    scraper.RETRY_WAIT = scraper.RETRY_MAX_WAIT = 0
+    error = aiohttp.ClientResponseError(mock.Mock(), (), status=status)
+    request_once = mock.AsyncMock(side_effect=error)
+
+    with mock.patch.object(scraper, "_request_once", request_once):
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(scraper._make_request("test"))
+
+    assert request_once.await_count == attempts
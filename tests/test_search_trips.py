@@ -0,0 +1,29 @@
+from datetime import datetime
+
+import pytest
+
+import flix
+
+
+def products(num_adults):
+    scraper = flix.FlixBusScraper()
+    params = scraper._search_trips_params(
+        "from", "to", datetime(2026, 1, 1), num_adults, "EUR", "en", True, False, False
+    )
+    return params["products"]
+
+
+@pytest.mark.parametrize("num_adults", [2, 2.0])
+def test_products_accepts_whole_numbers(num_adults):
+    assert products(num_adults) == '{"adult":2}'
+
+
+def test_products_rejects_fractional_float():
+    with pytest.raises(ValueError):
+        products(2.5)
+
+
+@pytest.mark.parametrize("num_adults", ["2", None])
+def test_products_rejects_non_numbers(num_adults):
+    with pytest.raises(TypeError):
+        products(num_adults)